@@ -10,7 +10,7 @@
 import datetime
 import io
 import unittest
-import EmayFileReader
+from emay2medview import EmayFileReader
 
 
 class EmayFileReaderTests(unittest.TestCase):
@@ -56,6 +56,14 @@ class EmayFileReaderTests(unittest.TestCase):
         self.assertIsNone(row[1], "SpO2(%) should be None")
         self.assertEqual(row[2], 83)
 
+    def test_invalid_fields(self):
+        # Non-numeric or negative SpO2/BPM values are `None`, like empty ones
+        csv = io.StringIO("Date,Time,SpO2(%),PR(bpm)\n2/26/2024,9:10:36 PM,abc,-5\n")
+        reader = EmayFileReader.EmayFileReader(csv)
+        row = next(reader)
+        self.assertIsNone(row[1], "SpO2(%) should be None")
+        self.assertIsNone(row[2], "PR(bpm) should be None")
+
     def test_happy_path(self):
         csv = io.StringIO(
             """Date,Time,SpO2(%),PR(bpm)
@@ -73,9 +81,77 @@ class EmayFileReaderTests(unittest.TestCase):
         self.assertEqual(row[0], datetime.datetime(2024, 2, 26, 21, 10, 39))
         self.assertEqual(row[1], 94)
         self.assertEqual(row[2], 92)
+        # Fields are also available by name
+        self.assertEqual(row.timestamp, row[0])
+        self.assertEqual(row.spo2, row[1])
+        self.assertEqual(row.bpm, row[2])
 
         self.assertRaises(StopIteration, next, reader)
 
+    def test_date_change(self):
+        # Rows that cross midnight pick up the new date
+        csv = io.StringIO(
+            """Date,Time,SpO2(%),PR(bpm)
+2/26/2024,11:59:59 PM,93,83
+2/27/2024,12:00:00 AM,94,84
+"""
+        )
+        reader = EmayFileReader.EmayFileReader(csv)
+        self.assertEqual(next(reader)[0], datetime.datetime(2024, 2, 26, 23, 59, 59))
+        self.assertEqual(next(reader)[0], datetime.datetime(2024, 2, 27, 0, 0, 0))
+
+    def test_crlf_and_blank_lines(self):
+        # Windows line endings and blank lines are tolerated
+        csv = io.StringIO(
+            "Date,Time,SpO2(%),PR(bpm)\r\n\r\n2/26/2024,9:10:35 PM,93,83\r\n\r\n"
+        )
+        reader = EmayFileReader.EmayFileReader(csv)
+        row = next(reader)
+        self.assertEqual(row[0], datetime.datetime(2024, 2, 26, 21, 10, 35))
+        self.assertEqual(reader.line_num, 3)
+        self.assertRaises(StopIteration, next, reader)
+
+    def test_times(self):
+        # 12-hour times, including around midnight and noon, 24-hour times, and
+        # times that need the general parser
+        csv = io.StringIO(
+            """Date,Time,SpO2(%),PR(bpm)
+2/26/2024,12:00:01 AM,93,83
+2/26/2024,12:00:02 PM,93,83
+2/26/2024,13:00:03,93,83
+2/26/2024,1:00:04 pm,93,83
+2/26/2024,13:00:05 PM,93,83
+"""
+        )
+        reader = EmayFileReader.EmayFileReader(csv)
+        self.assertEqual(next(reader)[0], datetime.datetime(2024, 2, 26, 0, 0, 1))
+        self.assertEqual(next(reader)[0], datetime.datetime(2024, 2, 26, 12, 0, 2))
+        self.assertEqual(next(reader)[0], datetime.datetime(2024, 2, 26, 13, 0, 3))
+        self.assertEqual(next(reader)[0], datetime.datetime(2024, 2, 26, 13, 0, 4))
+        self.assertRaises(StopIteration, next, reader)
+
+    def test_quoted_fields(self):
+        # Any of the fields, including the header, may be quoted
+        csv = io.StringIO(
+            '"Date","Time","SpO2(%)","PR(bpm)"\n"2/26/2024","9:10:35 PM","93","83"\n'
+        )
+        reader = EmayFileReader.EmayFileReader(csv)
+        row = next(reader)
+        self.assertEqual(row[0], datetime.datetime(2024, 2, 26, 21, 10, 35))
+        self.assertEqual(row[1], 93)
+        self.assertEqual(row[2], 83)
+        self.assertRaises(StopIteration, next, reader)
+
+    def test_binary_file(self):
+        # A file opened in binary mode works the same as a text file
+        csv = io.BytesIO(b"Date,Time,SpO2(%),PR(bpm)\r\n2/26/2024,9:10:35 PM,93,83\r\n")
+        reader = EmayFileReader.EmayFileReader(csv)
+        row = next(reader)
+        self.assertEqual(row[0], datetime.datetime(2024, 2, 26, 21, 10, 35))
+        self.assertEqual(row[1], 93)
+        self.assertEqual(row[2], 83)
+        self.assertRaises(StopIteration, next, reader)
+
     def test_iso8601_date_time(self):
         """Users 'ST Dog' and 'capman' reported problems with ISO 8601 dates and times"""
         csv = io.StringIO(
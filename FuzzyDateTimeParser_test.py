@@ -1,11 +1,14 @@
 #!/usr/bin/env python
 # coding: utf-8
 
-from FuzzyDateTimeParser import FuzzyDateTimeParser as fdtp
+from emay2medview.FuzzyDateTimeParser import FuzzyDateTimeParser as fdtp
 import datetime
 import unittest
 
 class FuzzyDateParserTests(unittest.TestCase):
+    def setUp(self):
+        self.parser = fdtp()
+
     def test_is_day_first(self):
         # Test cases where the day comes first
         self.assertTrue(fdtp.is_day_first("%d/%m/%Ey"))
@@ -20,6 +23,9 @@ class FuzzyDateParserTests(unittest.TestCase):
         # Year-month-day
         self.assertFalse(fdtp.is_day_first("%Y-%m-%d"))
 
+        # No day or month at all
+        self.assertFalse(fdtp.is_day_first("%Y"))
+
     def test_simplify_date_string(self):
         self.assertEqual(fdtp.simplify_date_string("2024. 05. 11"), "2024 05 11")
         self.assertEqual(fdtp.simplify_date_string("5/11/24"), "5 11 24")
@@ -28,21 +34,36 @@ class FuzzyDateParserTests(unittest.TestCase):
 
     def test_parse_with_d_fmt(self):
         # Test parsing if D_FMT was specified
-        # Instead of messing with os.environ, just set the value in the class
-        fdtp.d_fmt = "%m/%d/%Y"
-        self.assertEqual(fdtp.parse_date("05/11/2024"), datetime.datetime(year=2024, month=5, day=11))
-        fdtp.d_fmt = "%d.%m.%Y г."
-        self.assertEqual(fdtp.parse_date("11.5.2024 г."), datetime.datetime(year=2024, month=5, day=11))
+        # Instead of messing with os.environ, just set the value in the instance
+        self.parser.d_fmt = "%m/%d/%Y"
+        self.assertEqual(self.parser.parse_date("05/11/2024"), datetime.datetime(year=2024, month=5, day=11))
+        self.parser.d_fmt = "%d.%m.%Y г."
+        self.assertEqual(self.parser.parse_date("11.5.2024 г."), datetime.datetime(year=2024, month=5, day=11))
 
     def test_parse_without_d_fmt(self):
-        fdtp.d_fmt = None
-        self.assertEqual(fdtp.parse_date("01/01/2024"), datetime.datetime(year=2024, month=1, day=1))
-        self.assertEqual(fdtp.parse_date("1/1/24"), datetime.datetime(year=2024, month=1, day=1))
-        self.assertEqual(fdtp.parse_date("1.1.2024 г."), datetime.datetime(year=2024, month=1, day=1))
-        self.assertEqual(fdtp.parse_date("2024年01月01日"), datetime.datetime(year=2024, month=1, day=1))
+        self.parser.d_fmt = None
+        self.assertEqual(self.parser.parse_date("01/01/2024"), datetime.datetime(year=2024, month=1, day=1))
+        self.assertEqual(self.parser.parse_date("1/1/24"), datetime.datetime(year=2024, month=1, day=1))
+        self.assertEqual(self.parser.parse_date("1.1.2024 г."), datetime.datetime(year=2024, month=1, day=1))
+        self.assertEqual(self.parser.parse_date("2024年01月01日"), datetime.datetime(year=2024, month=1, day=1))
 
         # A nonsensical month-year-day format fails
-        self.assertRaises(ValueError, fdtp.parse_date, "05-2024-11")
+        self.assertRaises(ValueError, self.parser.parse_date, "05-2024-11")
+
+    def test_parse_iso8601(self):
+        self.parser.d_fmt = None
+        self.parser.t_fmt = None
+        self.assertEqual(self.parser.parse_date("2024-05-11"), datetime.datetime(year=2024, month=5, day=11))
+        self.assertEqual(self.parser.parse_time("23:59:00"), datetime.time(hour=23, minute=59, second=00))
+        # Not really ISO 8601, so fall back to the other formats
+        self.assertEqual(self.parser.parse_date("2024-5-11"), datetime.datetime(year=2024, month=5, day=11))
+        self.assertRaises(ValueError, self.parser.parse_date, "2024-02-30")
+
+    def test_two_digit_year(self):
+        # Two-digit years are split the same way strptime does it
+        self.parser.d_fmt = None
+        self.assertEqual(self.parser.parse_date("12/31/68"), datetime.datetime(year=2068, month=12, day=31))
+        self.assertEqual(self.parser.parse_date("12/31/69"), datetime.datetime(year=1969, month=12, day=31))
 
     def test_simplify_time_string(self):
         self.assertEqual(fdtp.simplify_time_string("12:34:56"), "12 34 56")
@@ -52,40 +73,54 @@ class FuzzyDateParserTests(unittest.TestCase):
 
     def test_parse_with_t_fmt(self):
         # Test parsing if T_FMT was specified
-        # Instead of messing with os.environ, just set the value in the class
-        fdtp.t_fmt = "%H:%M:%S"
-        self.assertEqual(fdtp.parse_time("12:34:56"), datetime.time(hour=12, minute=34, second=56))
-        fdtp.t_fmt = "%I:%M:%s %p"
-        self.assertEqual(fdtp.parse_time("12:34:56 pm"), datetime.time(hour=12, minute=34, second=56))
+        # Instead of messing with os.environ, just set the value in the instance
+        self.parser.t_fmt = "%H:%M:%S"
+        self.assertEqual(self.parser.parse_time("12:34:56"), datetime.time(hour=12, minute=34, second=56))
+        self.parser.t_fmt = "%I:%M:%s %p"
+        self.assertEqual(self.parser.parse_time("12:34:56 pm"), datetime.time(hour=12, minute=34, second=56))
 
     def test_parse_without_t_fmt(self):
-        fdtp.t_fmt = None
-        self.assertEqual(fdtp.parse_time("23-59-00"), datetime.time(hour=23, minute=59, second=00))
-        self.assertEqual(fdtp.parse_time("11:59:00 PM"), datetime.time(hour=23, minute=59, second=00))
-        self.assertEqual(fdtp.parse_time("%23時59分00秒"), datetime.time(hour=23, minute=59, second=00))
-        self.assertEqual(fdtp.parse_time("AM 12:34:56"), datetime.time(hour=0, minute=34, second=56))
+        self.parser.t_fmt = None
+        self.assertEqual(self.parser.parse_time("23-59-00"), datetime.time(hour=23, minute=59, second=00))
+        self.assertEqual(self.parser.parse_time("11:59:00 PM"), datetime.time(hour=23, minute=59, second=00))
+        self.assertEqual(self.parser.parse_time("%23時59分00秒"), datetime.time(hour=23, minute=59, second=00))
+        self.assertEqual(self.parser.parse_time("AM 12:34:56"), datetime.time(hour=0, minute=34, second=56))
+
+        # Hours that don't exist on a 12-hour clock fail
+        self.assertRaises(ValueError, self.parser.parse_time, "13:00:00 PM")
 
     def test_date_format_promotion(self):
-        # Verify that the logic works to move a successful format to the front
-        fdtp.d_fmt = None
+        # Verify that the logic works to try a successful format first next time
+        self.parser.d_fmt = None
         # Get the last value, and then format a date according to it
-        last_fmt = fdtp.date_formats[-1]
+        last_fmt = self.parser.date_formats[-1]
         christmas = datetime.datetime(year=2000, month=12, day=25)
         date_str = christmas.strftime(last_fmt)
-        # Now parse that date, and it should move `last_fmt` to the front
-        self.assertEqual(fdtp.parse_date(date_str), christmas)
-        self.assertEqual(fdtp.date_formats[0], last_fmt)
+        # Now parse that date, and `last_fmt` should become the preferred format
+        self.assertEqual(self.parser.parse_date(date_str), christmas)
+        self.assertEqual(self.parser.date_formats[self.parser.date_format_idx], last_fmt)
+        # The list of formats itself is left alone
+        self.assertEqual(self.parser.date_formats[-1], last_fmt)
 
     def test_time_format_promotion(self):
-        # Verify that the logic works to move a successful format to the front
-        fdtp.t_fmt = None
+        # Verify that the logic works to try a successful format first next time
+        self.parser.t_fmt = None
         # Get the second-to-last value, and then format a time according to it
-        last_fmt = fdtp.time_formats[-2]
+        last_fmt = self.parser.time_formats[-2]
         high_noon = datetime.time(hour=12, minute=0, second=0)
         time_str = high_noon.strftime(last_fmt)
-        # Now parse that time, and it should move `old_back` to the front
-        self.assertEqual(fdtp.parse_time(time_str), high_noon)
-        self.assertEqual(fdtp.time_formats[0], last_fmt)
+        # Now parse that time, and `last_fmt` should become the preferred format
+        self.assertEqual(self.parser.parse_time(time_str), high_noon)
+        self.assertEqual(self.parser.time_formats[self.parser.time_format_idx], last_fmt)
+
+    def test_independent_parsers(self):
+        # Learning a format in one parser doesn't change another parser
+        other = fdtp()
+        self.parser.d_fmt = None
+        last_fmt = self.parser.date_formats[-1]
+        self.parser.parse_date(datetime.datetime(year=2000, month=12, day=25).strftime(last_fmt))
+        self.assertEqual(self.parser.date_formats[self.parser.date_format_idx], last_fmt)
+        self.assertEqual(other.date_format_idx, 0)
 
 if __name__ == "__main__":
     unittest.main()
@@ -10,8 +10,9 @@
 import datetime
 import io
 import os
+import tempfile
 import unittest
-import MedViewFileWriter
+from emay2medview import MedViewFileWriter
 
 
 class fake_timestamp:
@@ -35,12 +36,21 @@ class incomplete_timestamp:
 
 
 class MedViewFileWriterTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Timestamps one second apart, for filling a file and then some.
+        # Building them takes longer than writing them, and datetimes are
+        # immutable, so build them once for all of the tests.
+        cls.timestamps = [
+            datetime.datetime(2024, 3, 1, n // 3600, (n // 60) % 60, n % 60)
+            for n in range(65536)
+        ]
+
     def test_empty(self):
         # Don't write any records, verify it has 0x00 0x00 0x00
         with io.BytesIO() as datfile:
-            dat = MedViewFileWriter.MedViewFileWriter(datfile)
-            # Force MedViewFileWriter to update the file header
-            dat = None
+            with MedViewFileWriter.MedViewFileWriter(datfile):
+                pass
             datfile.seek(0)
             content = datfile.read()
             self.assertEqual(content, b"\x00\x00\x00")
@@ -48,40 +58,80 @@ class MedViewFileWriterTests(unittest.TestCase):
     def test_single_record(self):
         # Write 1 record, verify entire contents
         with io.BytesIO() as datfile:
-            dat = MedViewFileWriter.MedViewFileWriter(datfile)
-            dat.write_record(datetime.datetime(2024, 3, 1, 23, 25, 00), 97, 82)
-            # Force MedViewFileWriter to update the file header
-            dat = None
+            with MedViewFileWriter.MedViewFileWriter(datfile) as dat:
+                dat.write_record(datetime.datetime(2024, 3, 1, 23, 25, 00), 97, 82)
             datfile.seek(0)
             content = datfile.read(3)
             self.assertEqual(content, b"\x00\x01\x00")
             content = datfile.read(11)
             self.assertEqual(content, b"\x00\x00\x00\x18\x03\x01\x17\x19\x00\x61\x52")
 
+    def test_time_offset(self):
+        # The time offset gets applied to every record
+        with io.BytesIO() as datfile:
+            with MedViewFileWriter.MedViewFileWriter(datfile, -3600) as dat:
+                dat.write_record(datetime.datetime(2024, 3, 1, 23, 25, 00), 97, 82)
+            datfile.seek(3)
+            content = datfile.read(11)
+            self.assertEqual(content, b"\x00\x00\x00\x18\x03\x01\x16\x19\x00\x61\x52")
+
+    def test_datetime_like_values(self):
+        # Something with the same fields as a datetime works, too
+        with io.BytesIO() as datfile:
+            with MedViewFileWriter.MedViewFileWriter(datfile) as dat:
+                ts = fake_timestamp()
+                ts.year, ts.month, ts.day = 2024, 3, 1
+                ts.hour, ts.minute, ts.second = 23, 25, 0
+                dat.write_record(ts, "97", 82.0)
+            datfile.seek(3)
+            content = datfile.read(11)
+            self.assertEqual(content, b"\x00\x00\x00\x18\x03\x01\x17\x19\x00\x61\x52")
+
     def test_multiple_records(self):
         # Write 10 records, verify header
         with io.BytesIO() as datfile:
+            with MedViewFileWriter.MedViewFileWriter(datfile) as dat:
+                for n in range(10):
+                    dat.write_record(datetime.datetime(2024, 3, 1, 23, 25, n), 97, 82)
+            datfile.seek(0)
+            content = datfile.read(3)
+            self.assertEqual(content, b"\x00\x0a\x00")
+
+    def test_single_write(self):
+        # Nothing is written until the header gets updated, and then the
+        # whole file is written at once
+        with io.BytesIO() as datfile:
+            writes = []
+            datfile.write = lambda data: writes.append(bytes(data))
             dat = MedViewFileWriter.MedViewFileWriter(datfile)
             for n in range(10):
                 dat.write_record(datetime.datetime(2024, 3, 1, 23, 25, n), 97, 82)
-            # Force MedViewFileWriter to update the file header
-            dat = None
+            self.assertEqual(writes, [])
+            dat.update_dat_header()
+            self.assertEqual(len(writes), 1)
+            self.assertEqual(len(writes[0]), 3 + 10 * 11)
+            self.assertEqual(writes[0][:3], b"\x00\x0a\x00")
+            # Updating again doesn't write anything else
+            dat.update_dat_header()
+            self.assertEqual(len(writes), 1)
+
+    def test_real_file(self):
+        # Write records to an actual file
+        with tempfile.TemporaryFile() as datfile:
+            with MedViewFileWriter.MedViewFileWriter(datfile) as dat:
+                for n in range(2):
+                    dat.write_record(datetime.datetime(2024, 3, 1, 23, 25, n), 97, 82)
             datfile.seek(0)
-            content = datfile.read(3)
-            self.assertEqual(content, b"\x00\x0a\x00")
+            content = datfile.read()
+            self.assertEqual(len(content), 3 + 2 * 11)
+            self.assertEqual(content[:3], b"\x00\x02\x00")
 
     def test_file_full(self):
         # Write 65535 records, should be 720888 bytes and header is 0x00 0xFF 0xFF
         with io.BytesIO() as datfile:
-            dat = MedViewFileWriter.MedViewFileWriter(datfile)
-            for n in range(65535):
-                dat.write_record(
-                    datetime.datetime(2024, 3, 1, n // 3600, (n // 60) % 60, n % 60),
-                    97,
-                    82,
-                )
-            # Force MedViewFileWriter to update the file header
-            dat = None
+            with MedViewFileWriter.MedViewFileWriter(datfile) as dat:
+                for ts in self.timestamps[:65535]:
+                    dat.write_record(ts, 97, 82)
             datfile.seek(0)
             content = datfile.read(3)
             self.assertEqual(content, b"\x00\xff\xff")
@@ -91,15 +141,9 @@ class MedViewFileWriterTests(unittest.TestCase):
         # The file should be 720888 bytes and header is 0x00 0xFF 0xFF.
         # Verify that record #65535 has contents expected, and was not overwritten
         with io.BytesIO() as datfile:
-            dat = MedViewFileWriter.MedViewFileWriter(datfile)
-            for n in range(65536):
-                dat.write_record(
-                    datetime.datetime(2024, 3, 1, n // 3600, (n // 60) % 60, n % 60),
-                    97,
-                    82,
-                )
-            # Force MedViewFileWriter to update the file header
-            dat = None
+            with MedViewFileWriter.MedViewFileWriter(datfile) as dat:
+                for ts in self.timestamps:
+                    dat.write_record(ts, 97, 82)
             datfile.seek(0)
             content = datfile.read(3)
             self.assertEqual(content, b"\x00\xff\xff")
@@ -109,17 +153,17 @@ class MedViewFileWriterTests(unittest.TestCase):
             content = datfile.read(11)
             self.assertEqual(content, b"\x00\x00\x00\x18\x03\x01\x12\x0C\x0E\x61\x52")
 
-    def test_too_many_records_assert(self):
-        # Verify the assertion for too many records
+    def test_too_many_records_clamped(self):
+        # Verify the count of records is clamped to the maximum
         with io.BytesIO() as datfile:
             dat = MedViewFileWriter.MedViewFileWriter(datfile)
             # Force the error condition
             dat.records = 65536
-            # Manually call the method that will assert
-            self.assertRaises(AssertionError, dat.update_dat_header)
-            # Put it back the way we found it
-            dat.records = 0
-            dat = None
+            dat.update_dat_header()
+            datfile.seek(0)
+            content = datfile.read()
+            self.assertEqual(content[:3], b"\x00\xff\xff")
+            self.assertEqual(len(content), 720888)
 
     def test_invalid_values(self):
         with io.BytesIO() as datfile:
@@ -140,6 +184,24 @@ class MedViewFileWriterTests(unittest.TestCase):
             # Verify nothing was written
             self.assertEqual(datfile.tell(), tell)
 
+    def test_out_of_range_values(self):
+        # Readings and years that don't fit in a byte are skipped, and the
+        # records around them are still written
+        with io.BytesIO() as datfile:
+            with MedViewFileWriter.MedViewFileWriter(datfile) as dat:
+                ts = datetime.datetime(2024, 3, 1, 23, 25, 00)
+                dat.write_record(ts, 97, 82)
+                for spo2, bpm in [(300, 80), (97, 65535), (-1, 80), (97, -1)]:
+                    dat.write_record(ts, spo2, bpm)
+                dat.write_record(datetime.datetime(1999, 3, 1, 23, 25, 00), 97, 82)
+                dat.write_record(ts, 97, 82)
+            datfile.seek(0)
+            content = datfile.read()
+            self.assertEqual(content[:3], b"\x00\x02\x00")
+            self.assertEqual(len(content), 3 + 2 * 11)
+            record = b"\x00\x00\x00\x18\x03\x01\x17\x19\x00\x61\x52"
+            self.assertEqual(content[3:], record * 2)
+
     def test_datetime_invalid_values(self):
         with io.BytesIO() as datfile:
             dat = MedViewFileWriter.MedViewFileWriter(datfile)
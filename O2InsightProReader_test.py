@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+# coding: utf-8
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2024 Paul Fagerburg
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+"""Unit tests for O2InsightProReader"""
+
+import datetime
+import io
+import unittest
+from emay2medview import O2InsightProReader
+
+HEADER = "Time,SpO2(%),Pulse Rate(bpm),Motion,SpO2 Reminder,PR Reminder\n"
+
+
+class O2InsightProReaderTests(unittest.TestCase):
+    def test_bad_header(self):
+        csv = io.StringIO(
+            'Date,Time,SpO2(%),PR(bpm)\n"09:10:35PM May 11, 2024",93,83,0,0,0\n'
+        )
+        reader = O2InsightProReader.O2InsightProReader(csv)
+        self.assertRaises(StopIteration, next, reader)
+
+    def test_empty_file(self):
+        reader = O2InsightProReader.O2InsightProReader(io.StringIO(""))
+        self.assertRaises(StopIteration, next, reader)
+
+    def test_bad_date_time(self):
+        csv = io.StringIO(HEADER + '"09:10:35PM Smarch 11, 2024",93,83,0,0,0\n')
+        reader = O2InsightProReader.O2InsightProReader(csv)
+        self.assertRaises(StopIteration, next, reader)
+
+    def test_missing_fields(self):
+        csv = io.StringIO(HEADER + '"09:10:35PM May 11, 2024",93\n')
+        reader = O2InsightProReader.O2InsightProReader(csv)
+        self.assertRaises(StopIteration, next, reader)
+
+    def test_empty_fields(self):
+        csv = io.StringIO(HEADER + '"09:10:35PM May 11, 2024",,83,0,0,0\n')
+        reader = O2InsightProReader.O2InsightProReader(csv)
+        row = next(reader)
+        self.assertIsNone(row[1], "SpO2(%) should be None")
+        self.assertEqual(row[2], 83)
+
+        csv = io.StringIO(HEADER + '"09:10:35PM May 11, 2024",93,--,0,0,0\n')
+        reader = O2InsightProReader.O2InsightProReader(csv)
+        row = next(reader)
+        self.assertEqual(row[1], 93)
+        self.assertIsNone(row[2], "Pulse Rate(bpm) should be None")
+
+    def test_end_of_collection(self):
+        # 255/65535 records mark the end of a collection and are skipped
+        csv = io.StringIO(
+            HEADER
+            + '"09:10:35PM May 11, 2024",255,65535,0,0,0\n'
+            + '"--:--:--",255,65535,0,0,0\n'
+            + '"09:10:36PM May 11, 2024",94,84,0,0,0\n'
+        )
+        reader = O2InsightProReader.O2InsightProReader(csv)
+        row = next(reader)
+        self.assertEqual(row[0], datetime.datetime(2024, 5, 11, 21, 10, 36))
+        self.assertRaises(StopIteration, next, reader)
+
+    def test_month_names(self):
+        # Full and abbreviated month names, in any case
+        csv = io.StringIO(
+            HEADER
+            + '"12:00:00PM September 12, 2024",93,83,0,0,0\n'
+            + '"12:00:00am DEC 12, 2024",93,83,0,0,0\n'
+        )
+        reader = O2InsightProReader.O2InsightProReader(csv)
+        self.assertEqual(next(reader)[0], datetime.datetime(2024, 9, 12, 12, 0, 0))
+        self.assertEqual(next(reader)[0], datetime.datetime(2024, 12, 12, 0, 0, 0))
+
+    def test_happy_path(self):
+        csv = io.StringIO(
+            HEADER
+            + '"09:10:35PM May 11, 2024",93,83,0,0,0\n'
+            + "\n"
+            + '"12:01:00AM Sep 12, 2024",94,92,3,0,0\n'
+        )
+        reader = O2InsightProReader.O2InsightProReader(csv)
+        row = next(reader)
+        self.assertEqual(row[0], datetime.datetime(2024, 5, 11, 21, 10, 35))
+        self.assertEqual(row[1], 93)
+        self.assertEqual(row[2], 83)
+
+        row = next(reader)
+        self.assertEqual(row[0], datetime.datetime(2024, 9, 12, 0, 1, 0))
+        self.assertEqual(row[1], 94)
+        self.assertEqual(row[2], 92)
+
+        self.assertRaises(StopIteration, next, reader)
+
+    def test_binary_file(self):
+        # A file opened in binary mode works the same as a text file
+        csv = io.BytesIO(HEADER.encode() + b'"09:10:35PM May 11, 2024",93,83,0,0,0\r\n')
+        reader = O2InsightProReader.O2InsightProReader(csv)
+        row = next(reader)
+        self.assertEqual(row[0], datetime.datetime(2024, 5, 11, 21, 10, 35))
+        self.assertEqual(row[1], 93)
+        self.assertEqual(row[2], 83)
+        self.assertRaises(StopIteration, next, reader)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+# coding: utf-8
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2024 Paul Fagerburg
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+"""Unit tests for the emay2medview command line interface"""
+
+import lzma
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from click.testing import CliRunner
+import emay2medview
+from emay2medview import cli
+
+CSV = (
+    "Date,Time,SpO2(%),PR(bpm)\n"
+    "2/26/2024,9:10:35 PM,93,83\n"
+    "2/26/2024,9:10:36 PM,94,84\n"
+)
+DAT = (
+    b"\x00\x02\x00"
+    + b"\x00\x00\x00\x18\x02\x1a\x15\x0a\x23\x5d\x53"
+    + b"\x00\x00\x00\x18\x02\x1a\x15\x0a\x24\x5e\x54"
+)
+
+
+class CliTests(unittest.TestCase):
+    def convert(self, *args):
+        # Run the command on a 2-row EMAY CSV file, and return the result and
+        # the name of the DAT file
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        csvname = os.path.join(tmpdir.name, "test.csv")
+        datname = os.path.join(tmpdir.name, "out.dat")
+        with open(csvname, "w") as csvfile:
+            csvfile.write(CSV)
+        result = CliRunner().invoke(
+            cli.command(), [csvname, "-o", datname, *args], env={"CSV_FORMAT": None}
+        )
+        return result, datname
+
+    def test_convert(self):
+        result, datname = self.convert()
+        self.assertEqual(result.exit_code, 0, result.output)
+        with open(datname, "rb") as datfile:
+            self.assertEqual(datfile.read(), DAT)
+        self.assertFalse(os.path.exists(datname + ".xz"))
+
+    def test_convert_compress(self):
+        result, datname = self.convert("--compress")
+        self.assertEqual(result.exit_code, 0, result.output)
+        with open(datname, "rb") as datfile:
+            self.assertEqual(datfile.read(), DAT)
+        with lzma.open(datname + ".xz", "rb") as xzfile:
+            self.assertEqual(xzfile.read(), DAT)
+
+    def test_entry_points(self):
+        # The package's entry points are the ones in cli, looked up lazily
+        self.assertIs(emay2medview.main, cli.main)
+        self.assertIs(emay2medview.o2insight2medview, cli.o2insight2medview)
+
+    def test_import_without_click(self):
+        # Importing the package doesn't load click. This test process already
+        # has click loaded, so check in a fresh interpreter.
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, emay2medview; print('click' in sys.modules)",
+            ],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        self.assertEqual(result.stdout.strip(), "False")
+
+    def test_compress_file(self):
+        # The compressed copy decompresses to the original bytes, and the
+        # original file is left alone
+        content = b"\x00\x02\x00" + 2 * b"\x00\x00\x00\x18\x03\x01\x17\x19\x00\x61\x52"
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, "test.dat")
+            with open(filename, "wb") as datfile:
+                datfile.write(content)
+
+            cli.compress_file(filename)
+
+            with lzma.open(filename + ".xz", "rb") as xzfile:
+                self.assertEqual(xzfile.read(), content)
+            with open(filename, "rb") as datfile:
+                self.assertEqual(datfile.read(), content)
+
+
+if __name__ == "__main__":
+    unittest.main()
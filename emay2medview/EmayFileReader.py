@@ -0,0 +1,167 @@
+#!/usr/bin/env python
+# coding: utf-8
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2024 Paul Fagerburg
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+"""Read data files in CVS format produces by EMAY brand pulse oximeters.
+
+
+This class implements an iterator that returns EmayRecord named tuples of
+a timestamp, an SpO2 reading, and a Pulse Rate reading.
+
+Usage example:
+```
+with open("sample.csv", "rb") as csvfile:
+    emay = EmayFileReader.EmayFileReader(csvfile)
+
+    for val in emay:
+        print(str(val.timestamp), val.spo2, val.bpm)
+
+2024-02-26 21:10:35 93 83
+2024-02-26 21:10:36 93 83
+etc.
+```
+
+The software provided with EMAY pulse oximiters creates a CSV file
+containing all of the data.
+
+The first row is a header:
+    Date,Time,SpO2(%),PR(bpm)
+
+Each row after that contains a date (in USA month/day/year order), a time
+in 12-hour format, an integer for the SpO2%, and an integer for the pulse
+rate:
+    2/26/2024,9:10:35 PM,93,83
+
+Based on code by user "joeblough", used by permission. Original post at
+https://www.apneaboard.com/forums/Thread-python-file-converter-for-EMAY-sleep-pulse-oximeter
+"""
+
+import collections
+import csv
+import datetime
+import locale
+import logging
+from . import FuzzyDateTimeParser
+
+# One row of an EMAY CSV file. It's a tuple, so unpacking or indexing it works
+# the same as attribute access.
+EmayRecord = collections.namedtuple("EmayRecord", ("timestamp", "spo2", "bpm"))
+
+
+class EmayFileReader:
+    fieldnames = ["Date", "Time", "SpO2(%)", "PR(bpm)"]
+    # SpO2 and pulse rate are small non-negative integers, so the usual values
+    # are looked up in a prebuilt table instead of calling int() on each field
+    readings = {str(n): n for n in range(256)}
+
+    def __init__(self, csvfile):
+        text = csvfile.read()
+        if isinstance(text, bytes):
+            # A file opened in binary mode is decoded in a single call, rather
+            # than a chunk at a time by a text-mode file object
+            text = text.decode(locale.getpreferredencoding(False))
+
+        # Tokenize the whole file in one batch: split it into lines, and parse
+        # each line into fields. Iteration then just walks this list. The
+        # fields may be quoted, so this needs a real CSV parser rather than
+        # splitting on commas.
+        self.rows = list(csv.reader(text.splitlines()))
+        # Physical line number of the most recently returned row (the header
+        # is line 1).
+        self.line_num = 1
+        # Each file gets its own date/time parser, so the formats it settles on
+        # don't carry over to other files
+        self.parser = FuzzyDateTimeParser.FuzzyDateTimeParser()
+        # The date is the same for thousands of rows in a row, so remember the
+        # last date string and what it parsed to
+        self.last_date_s = None
+        self.last_date = None
+
+        if not self.rows or self.rows[0] != self.fieldnames:
+            logging.error(f"CSV file does not appear to be a valid EMAY CSV file")
+            self.rows = []
+
+    def __iter__(self):
+        return self
+
+    def parse_time(self, time_s):
+        """Parse a time from an EMAY CSV file.
+
+        EMAY times are almost always "H:MM:SS AM/PM" or "HH:MM:SS", so handle
+        those by splitting the string, which is much quicker than the general
+        parser. Anything else (or a user-supplied T_FMT) goes to the
+        FuzzyDateTimeParser.
+
+        Params:
+            time_s - string representing a time
+
+        Returns:
+            datetime.time for the string. Or it raises a ValueError.
+        """
+        hms, _, ampm = time_s.partition(" ")
+        parts = hms.split(":")
+        if (
+            self.parser.t_fmt is None
+            and len(parts) == 3
+            and ampm in ("", "AM", "PM")
+            and hms.replace(":", "").isdecimal()
+        ):
+            hour, minute, second = int(parts[0]), int(parts[1]), int(parts[2])
+            if ampm:
+                if not 1 <= hour <= 12:
+                    raise ValueError(f"{time_s} has an invalid hour")
+                hour = hour % 12 + (12 if ampm == "PM" else 0)
+            return datetime.time(hour, minute, second)
+
+        return self.parser.parse_time(time_s)
+
+    def __next__(self):
+        # Skip blank lines, like csv.DictReader does
+        while True:
+            if self.line_num >= len(self.rows):
+                raise StopIteration
+            fields = self.rows[self.line_num]
+            self.line_num += 1
+            if fields:
+                break
+
+        if len(fields) < len(self.fieldnames):
+            logging.error(
+                f"Missing {self.fieldnames[len(fields)]} value line {self.line_num}"
+            )
+            raise StopIteration
+        date_s, time_s, o2_s, bpm_s = fields[:4]
+
+        try:
+            if date_s != self.last_date_s:
+                self.last_date = self.parser.parse_date(date_s)
+                self.last_date_s = date_s
+            timestamp = datetime.datetime.combine(
+                self.last_date, self.parse_time(time_s)
+            )
+        except (ValueError, AttributeError):
+            logging.error(
+                f'Invalid date/time "{date_s} {time_s}" on line {self.line_num}'
+            )
+            raise StopIteration
+
+        # Anything that isn't in the table and isn't all digits (e.g. an empty
+        # field) is invalid; checking up front avoids raising an exception
+        o2 = self.readings.get(o2_s)
+        if o2 is None:
+            if o2_s.strip().isdecimal():
+                o2 = int(o2_s)
+            else:
+                logging.warning(f"Empty/invalid SpO2(%) value line {self.line_num}")
+
+        bpm = self.readings.get(bpm_s)
+        if bpm is None:
+            if bpm_s.strip().isdecimal():
+                bpm = int(bpm_s)
+            else:
+                logging.warning(f"Empty/invalid PR(bpm) value line {self.line_num}")
+
+        return EmayRecord(timestamp, o2, bpm)
@@ -0,0 +1,360 @@
+#!/usr/bin/env python
+# coding: utf-8
+"""Parse date and time strings according to user preference, system environment, and heuristics.
+
+TL;DR turning a string representation of a date or time into a numeric representation is hard.
+
+Depending on where you are in the world (or where your operating system believes
+you are), the year, month, or day can come first. The separators between the
+numbers vary, sometimes simple punctuation, sometimes a letter or character,
+depending on the language. So use a little help from the user plus some heuristics.
+
+If the user sets D_FMT in the OS environment, use that to parse the date string.
+If D_FMT is not set, or if the parsing fails, an ISO 8601 date (2024-05-11) is
+parsed directly. Otherwise, the rest of the algorithm is:
+
+* Simplify the date string into numbers separated by single spaces
+* Use a list of common formats to try to parse the simplified date string
+* Try the format that worked last time first
+* If the parsing fails, try the other format strings in order
+* If one of them is successful, remember it as the one to try first next time
+* If we get to the end of the format list, throw an exception
+
+The list of formats is initially ordered based on whether we find the format
+characters for day (d or e) or month (m) first in the locale's D_FMT string.
+
+Parsing a time is marginally easier than parsing a date; the first number is always the
+hours, then the minutes, then the seconds, but the separators, 12-hour vs. 24-hour,
+placement of AM/PM, whether the hours have a leading zero, etc. can vary.
+
+Same algorithm for the time: use T_FMT from the environment if set, otherwise
+simplify the time into digits, spaces, and AM/PM, and then try to parse with
+various formats.
+
+The formats are written as strptime format strings, but the simplified strings
+are never handed to strptime, which is slow. Instead, each format is compiled
+once into a regular expression, and the matched numbers go straight into the
+datetime constructors.
+"""
+
+import datetime
+import functools
+import locale
+import os
+import re
+
+
+class SpaceTranslation(dict):
+    """Table for `str.translate` that turns unwanted characters into spaces
+
+    Digits and any characters in `keep` map to themselves; everything else maps
+    to a space. Each character is classified the first time it is seen and the
+    result is remembered, so translating a string is a single pass in C.
+    """
+
+    def __init__(self, keep=""):
+        super().__init__()
+        self.keep = keep
+
+    def __missing__(self, codepoint):
+        char = chr(codepoint)
+        value = codepoint if char.isdecimal() or char in self.keep else " "
+        self[codepoint] = value
+        return value
+
+
+class FuzzyDateTimeParser:
+    # Translation tables used to simplify date and time strings
+    date_translation = SpaceTranslation()
+    time_translation = SpaceTranslation("APMapm")
+
+    # Formats to try for parsing a date, depending on whether the locale puts
+    # the day or the month first, and formats to try for parsing a time
+    day_first_formats = (
+        "%d %m %Y",
+        "%d %m %y",
+        "%m %d %Y",
+        "%m %d %y",
+        "%Y %m %d",
+    )
+    month_first_formats = (
+        "%m %d %Y",
+        "%m %d %y",
+        "%Y %m %d",
+        "%d %m %Y",
+        "%d %m %y",
+    )
+    time_formats = ("%H %M %S", "%I %M %S %p", "%p %I %M %S")
+
+    # Regular expression for each strptime directive used in the formats above
+    directives = {
+        "%d": r"(?P<day>\d{1,2})",
+        "%m": r"(?P<month>\d{1,2})",
+        "%Y": r"(?P<year>\d{4})",
+        "%y": r"(?P<yy>\d{2})",
+        "%H": r"(?P<hour>\d{1,2})",
+        "%I": r"(?P<hour12>\d{1,2})",
+        "%M": r"(?P<minute>\d{1,2})",
+        "%S": r"(?P<second>\d{1,2})",
+        "%p": r"(?P<ampm>[AaPp][Mm])",
+    }
+
+    def __init__(self):
+        """Set up a parser with its own format preferences
+
+        Use `locale.nl_langinfo(locale.D_FMT)` to see if the day is first, and
+        decide if "%d %m %Y" and "%d %m %y" come first in the list of date
+        formats, or "%m %d %Y" and "%m %d %y" do. Also put the year-month-day
+        format in the list.
+
+        Each parser remembers which formats worked for it, so parsers used for
+        different files (or in different threads) don't affect each other.
+        """
+        # User can specify D_FMT and/or T_FMT, which will take first priority
+        self.d_fmt = os.getenv("D_FMT", None)
+        self.t_fmt = os.getenv("T_FMT", None)
+
+        if FuzzyDateTimeParser.is_day_first(locale.nl_langinfo(locale.D_FMT)):
+            self.date_formats = FuzzyDateTimeParser.day_first_formats
+        else:
+            self.date_formats = FuzzyDateTimeParser.month_first_formats
+
+        # Index of the format that worked last time, which gets tried first
+        self.date_format_idx = 0
+        self.time_format_idx = 0
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def compile_format(fmt):
+        """Translate a space-separated format string into a regular expression
+
+        For example, "%d %m %Y" becomes a pattern that matches "11 5 2024" and
+        captures the groups "day", "month", and "year". Each format is compiled
+        the first time it's used, and the result is cached.
+
+        Params:
+            fmt - format string made of the directives in `directives`,
+                separated by single spaces
+
+        Returns:
+            compiled regular expression, to be used with `fullmatch`
+        """
+        return re.compile(
+            " ".join(FuzzyDateTimeParser.directives[d] for d in fmt.split(" "))
+        )
+
+    @staticmethod
+    def build_date(fields):
+        """Construct a date from the groups matched by a compiled date format
+
+        Two-digit years follow the same rule as strptime: 69-99 are in the
+        1900s, 00-68 are in the 2000s.
+
+        Params:
+            fields - dict of the matched groups, as strings of digits
+
+        Returns:
+            datetime for midnight of that date. Or it raises a ValueError.
+        """
+        if "year" in fields:
+            year = int(fields["year"])
+        else:
+            year = int(fields["yy"])
+            year += 1900 if year >= 69 else 2000
+        return datetime.datetime(year, int(fields["month"]), int(fields["day"]))
+
+    @staticmethod
+    def build_time(fields):
+        """Construct a time from the groups matched by a compiled time format
+
+        Params:
+            fields - dict of the matched groups, as strings of digits (and AM/PM)
+
+        Returns:
+            time represented by the fields. Or it raises a ValueError.
+        """
+        if "hour" in fields:
+            hour = int(fields["hour"])
+        else:
+            hour = int(fields["hour12"])
+            if not 1 <= hour <= 12:
+                raise ValueError(f"hour {hour} is out of range for a 12-hour clock")
+            hour %= 12
+            if fields["ampm"].upper() == "PM":
+                hour += 12
+        return datetime.time(hour, int(fields["minute"]), int(fields["second"]))
+
+    @staticmethod
+    def try_formats(simp, formats, preferred, build):
+        """Parse a simplified date or time string with the first format that fits
+
+        The preferred format is tried first, then the rest of them in order.
+
+        Params:
+            simp - simplified date or time string
+            formats - tuple of format strings to try
+            preferred - index into `formats` of the format to try first
+            build - build_date or build_time, to construct the parsed value
+
+        Returns:
+            tuple of the index of the format that worked and the parsed value,
+            or (None, None) if none of them worked
+        """
+        value = FuzzyDateTimeParser.try_format(simp, formats[preferred], build)
+        if value is not None:
+            return preferred, value
+
+        for idx, fmt in enumerate(formats):
+            if idx == preferred:
+                continue
+            value = FuzzyDateTimeParser.try_format(simp, fmt, build)
+            if value is not None:
+                return idx, value
+        return None, None
+
+    @staticmethod
+    def try_format(simp, fmt, build):
+        """Parse a simplified date or time string with one format
+
+        Returns:
+            the parsed value, or None if the string doesn't fit the format
+        """
+        match = FuzzyDateTimeParser.compile_format(fmt).fullmatch(simp)
+        if match is None:
+            return None
+        try:
+            return build(match.groupdict())
+        except ValueError:
+            return None
+
+    @staticmethod
+    def is_day_first(d_fmt):
+        """Determine if the default locale puts the month or day first
+
+        Find the first of the format characters for day (d or e) or month (m)
+        in a date format string, and check which one it is.
+
+        Returns:
+            True if the day comes before the month in the date string
+        """
+        found = [idx for idx in map(d_fmt.find, "dem") if idx >= 0]
+        # Probably should have found d/e or m, so IDK?
+        if not found:
+            return False
+        return d_fmt[min(found)] in "de"
+
+    @staticmethod
+    def simplify_date_string(date_str):
+        """Simplify date string by replacing all non-digits with a space.
+
+        For example, "2024. 05. 11" becomes "2024 05 11". Similarly, any date
+        strings that use extra letters/characters (such as "11.5.2024 г." or
+        "2024年05月11日") have those removed and replaced with a single space.
+
+        Params:
+            date_str - string representing a date
+
+        Returns:
+            the string with any non-digits replaced by a single space, no
+            leading or trailing spaces, either
+        """
+        return " ".join(
+            date_str.translate(FuzzyDateTimeParser.date_translation).split()
+        )
+
+    @staticmethod
+    def simplify_time_string(time_str):
+        """Simplify time string by replacing all non-digits with a space, but save AM/PM
+
+        Params:
+            time_str - string representing a time
+
+        Returns:
+            the string with any non-digits replaced by a single space, with any AM/PM
+            preserved, no leading or trailing spaces, either
+        """
+        return " ".join(
+            time_str.translate(FuzzyDateTimeParser.time_translation).split()
+        )
+
+    def parse_date(self, date_str):
+        """Parse a date string.
+
+        Try to parse with a user-supplied date format if available. Then simplify
+        the string to just numbers and spaces and try parsing with various formats.
+        If one of those formats is successful, try that one first next time.
+
+        Params:
+            date_str - string representing a date
+
+        Returns:
+            datetime representing the best guess at the date the string represents.
+            Or it raises a ValueError.
+        """
+        # First try to parse with user-supplied date format
+        try:
+            if self.d_fmt is not None:
+                return datetime.datetime.strptime(date_str, self.d_fmt)
+        except ValueError:
+            pass
+
+        # ISO 8601 dates (YYYY-MM-DD) can be parsed directly, in C
+        if len(date_str) == 10 and date_str[4] == "-" and date_str[7] == "-":
+            try:
+                return datetime.datetime.fromisoformat(date_str)
+            except ValueError:
+                pass
+
+        # Now simplify the date string and try the various formats
+        simp = FuzzyDateTimeParser.simplify_date_string(date_str)
+        idx, d = FuzzyDateTimeParser.try_formats(
+            simp,
+            self.date_formats,
+            self.date_format_idx,
+            FuzzyDateTimeParser.build_date,
+        )
+        if d is not None:
+            self.date_format_idx = idx
+            return d
+        # nothing parsed correctly
+        raise ValueError(f"{date_str} ({simp}) could not be parsed as a date")
+
+    def parse_time(self, time_str):
+        """Parse a time string.
+
+        Same logic as parse_date, just has fewer formats and has to preserve AM/PM.
+
+        Params:
+            time_str - string representing a time
+
+        Returns:
+            time representing the best guess at the time the string represents.
+            Or it raises a ValueError.
+        """
+        # First try to parse with user-supplied time format
+        try:
+            if self.t_fmt is not None:
+                return datetime.datetime.strptime(time_str, self.t_fmt).time()
+        except ValueError:
+            pass
+
+        # Likewise for ISO 8601 times (HH:MM:SS)
+        if len(time_str) == 8 and time_str[2] == ":" and time_str[5] == ":":
+            try:
+                return datetime.time.fromisoformat(time_str)
+            except ValueError:
+                pass
+
+        # Now simplify the time string and try the various formats
+        simp = FuzzyDateTimeParser.simplify_time_string(time_str)
+        idx, t = FuzzyDateTimeParser.try_formats(
+            simp,
+            self.time_formats,
+            self.time_format_idx,
+            FuzzyDateTimeParser.build_time,
+        )
+        if t is not None:
+            self.time_format_idx = idx
+            return t
+        # nothing parsed correctly
+        raise ValueError(f"{time_str} ({simp}) could not be parsed as a time")
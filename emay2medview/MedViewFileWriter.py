@@ -0,0 +1,192 @@
+#!/usr/bin/env python
+# coding: utf-8
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2024 Paul Fagerburg
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+"""Write data files in MedView[TM] format.
+
+MedView is the name of the software that works with ChoiceMMed[TM]
+pulse oximeters.
+
+This class writes time-stamped SpO2 and BPM values to a binary file.
+Usage example:
+
+```
+with open(output_filename, "wb") as datfile:
+    with MedViewFileWriter.MedViewFileWriter(datfile, timeOffset) as dat:
+        # ...
+        # [magic happens here, and now ts is a date and time,
+        # and o2 and bpm have valid values]
+        # ...
+        dat.write_record(ts, o2, bpm)
+```
+The file is built in memory (it can't be bigger than about 720 KiB).
+When the `with` block for the MedViewFileWriter ends, the count of records
+is filled in and the whole file is written with a single call, before the
+file itself gets closed. The MedViewFileWriter has to be used in a `with`
+statement (or update_dat_header() called explicitly), otherwise nothing is
+written.
+
+A file starts with an ID byte (which we set to 0), and the number of
+records in 16-bit little-endian format. A file can have at most 65535
+records.
+
+Each record in the file is 11 bytes. The bytes are, in order:
+    0 - purpose unknown
+    0 - purpose unknown
+    0 - purpose unknown
+    Year, 2-digits only
+    Month
+    Day
+    Hour (0-23)
+    Minute
+    Second
+    SpO2
+    BPM
+
+ChoiceMMed and MedView are trademarks of Beijing Choice Electronic Tech Co.
+I found the registration for ChoiceMMed, but couldn't find it for MedView,
+but I'm assuming that's trademarked, too.
+
+Based on code by user "joeblough", used by permission. Original post at
+https://www.apneaboard.com/forums/Thread-python-file-converter-for-EMAY-sleep-pulse-oximeter
+"""
+
+import logging
+import struct
+import datetime
+
+
+class MedViewFileWriter:
+    # Layout of a record and of the count of records in the file header,
+    # compiled once rather than on every call
+    record_struct = struct.Struct("@xxxBBBBBBBB")
+    count_struct = struct.Struct("<H")
+    # The file starts with an ID byte (0) and the count of records, which
+    # gets filled in when the file is finished
+    header = b"\x00\x00\x00"
+    # Size of the file header and of one record in bytes
+    header_size = len(header)
+    record_size = record_struct.size
+    # Maximum number of records in a file
+    max_records = 65535
+
+    def __init__(self, datfile, timeOffset=0):
+        # Keep track of the number of records written to output file.
+        self.records = 0
+        # The whole file (at most ~720 KiB) is built here, starting with the
+        # header, and written to the DAT file in one go when it's finished.
+        self.buffer = bytearray(self.header_size + self.max_records * self.record_size)
+        self.buffer[: self.header_size] = self.header
+        # File handle for the DAT file
+        self.datfile = datfile
+        # optional timestamp correction offset
+        self.timeOffset = timeOffset
+        self.timeDelta = datetime.timedelta(seconds=timeOffset)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, tb):
+        self.update_dat_header()
+        self.datfile = None
+
+    def update_dat_header(self):
+        """Fill in the count of records, then write the whole file."""
+        logging.debug(f"update_dat_header, records = {self.records}")
+        # If the file was already written, nothing to update
+        if self.datfile is None:
+            logging.debug("NOP")
+            return
+
+        # write_record never goes past the maximum, but make sure the count
+        # can't either
+        count = min(self.records, self.max_records)
+
+        # Fill in the count of records at the start of the file, after the
+        # ID byte, and write the header and records with a single call.
+        # Slicing a memoryview of the buffer doesn't copy it.
+        self.count_struct.pack_into(self.buffer, 1, count)
+        size = self.header_size + count * self.record_size
+        self.datfile.write(memoryview(self.buffer)[:size])
+        self.datfile = None
+
+    def write_record(self, timestamp, o2, bpm):
+        """Write a single data record to the file.
+
+        If any of the parameters are invalid, the record will not be written.
+
+        Params:
+            timestamp - a datetime.datetime object
+            o2 - SpO2 percentage, represented as an integer
+            bpm - BPM
+        """
+        # If we hit the maximum number of records, log an error and exit
+        if self.records >= self.max_records:
+            logging.error("Maximum number of output records exceeded.")
+            return
+
+        # The readers already produce ints, so only convert other types
+        if type(o2) is not int:
+            try:
+                o2 = int(o2)
+            except (ValueError, TypeError):
+                logging.error(f"Invalid SpO2 value: '{o2}'")
+                return
+
+        if type(bpm) is not int:
+            try:
+                bpm = int(bpm)
+            except (ValueError, TypeError):
+                logging.error(f"Invalid BPM value: '{bpm}'")
+                return
+
+        # Each reading is stored in a single byte
+        if not 0 <= o2 <= 255:
+            logging.error(f"SpO2 value out of range: '{o2}'")
+            return
+
+        if not 0 <= bpm <= 255:
+            logging.error(f"BPM value out of range: '{bpm}'")
+            return
+
+        try:
+            # Apply the time offset
+            if self.timeDelta:
+                timestamp += self.timeDelta
+
+            # The readers produce datetimes, whose fields are already valid
+            # ints. Anything else that looks like one gets checked by turning
+            # it into a real datetime.
+            if type(timestamp) is not datetime.datetime:
+                timestamp = datetime.datetime(
+                    int(timestamp.year),
+                    int(timestamp.month),
+                    int(timestamp.day),
+                    int(timestamp.hour),
+                    int(timestamp.minute),
+                    int(timestamp.second),
+                )
+
+            self.record_struct.pack_into(
+                self.buffer,
+                self.header_size + self.records * self.record_size,
+                timestamp.year - 2000,  # 2-digit year only
+                timestamp.month,
+                timestamp.day,
+                timestamp.hour,
+                timestamp.minute,
+                timestamp.second,
+                o2,
+                bpm,
+            )
+        except (ValueError, TypeError, AttributeError, struct.error):
+            # The timestamp could be missing a field, or one of the fields
+            # could be the wrong type or an invalid value. The year also has
+            # to fit in a byte after subtracting 2000.
+            logging.error(f"Invalid timestamp: '{timestamp}'")
+            return
+
+        self.records += 1
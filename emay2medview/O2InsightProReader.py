@@ -0,0 +1,156 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+Read data files in CVS format produced by Wellue's O2 Insight Pro.
+
+This has been tested with data from Wellue's O2Ring Oximeter.
+
+The first row is the header:
+    Time,SpO2(%),Pulse Rate(bpm),Motion,SpO2 Reminder,PR Reminder
+        Time is in the format HH:MM:SS{AM|PM} Month Day, Year
+        HH is 12-hour format
+        This appears to be independent of any OS settings for date/time formats.
+
+    SpO2 is an integer in percent (0-100)
+
+    Pulse Rate is an integer in beats per minute
+
+    Motion and the Reminder fields are not used
+"""
+
+import calendar
+import csv
+import datetime
+import locale
+import logging
+import re
+
+
+class O2InsightProReader:
+    # only have "May" data from the app at this point
+    # maybe it's the full month name or the abbreviation...
+    timeFormats = ["%I:%M:%S%p %B %d, %Y", "%I:%M:%S%p %b %d, %Y"]
+
+    # The same formats as a regular expression, plus the month numbers for the
+    # full and abbreviated month names, so times can be parsed without strptime
+    timePattern = re.compile(
+        r"(\d{1,2}):(\d{1,2}):(\d{1,2})([AaPp][Mm]) ([^\W\d_]+) (\d{1,2}), (\d{4})"
+    )
+    months = {
+        name.lower(): num
+        for names in (calendar.month_name, calendar.month_abbr)
+        for num, name in enumerate(names)
+        if name
+    }
+
+    fieldnames = [
+        "Time",
+        "SpO2(%)",
+        "Pulse Rate(bpm)",
+        "Motion",
+        "SpO2 Reminder",
+        "PR Reminder",
+    ]
+
+    def __init__(self, csvfile):
+        text = csvfile.read()
+        if isinstance(text, bytes):
+            # A file opened in binary mode is decoded in a single call, rather
+            # than a chunk at a time by a text-mode file object
+            text = text.decode(locale.getpreferredencoding(False))
+
+        # Plain csv.reader rows are lists, so there's no dict to build per row.
+        # The Time field is quoted and contains a comma, so the rows still need
+        # a real CSV parser rather than splitting on commas.
+        self.reader = csv.reader(text.splitlines())
+
+        if next(self.reader, [])[:6] != self.fieldnames:
+            logging.error(
+                f"CSV file does not appear to be a valid O2 Insight Pro CSV file"
+            )
+            self.reader = None
+
+    def __iter__(self):
+        return self
+
+    def parse_time(self, time_s):
+        """Parse the Time column, e.g. "09:10:35PM May 11, 2024"
+
+        Match the string against `timePattern` and build the datetime directly.
+        If that doesn't work, fall back to trying `timeFormats` with strptime.
+
+        Returns:
+            datetime for the string. Or it raises a ValueError.
+        """
+        match = self.timePattern.fullmatch(time_s)
+        if match is not None:
+            hour, minute, second, ampm, month, day, year = match.groups()
+            hour = int(hour)
+            month = self.months.get(month.lower())
+            if month is not None and 1 <= hour <= 12:
+                hour = hour % 12 + (12 if ampm.upper() == "PM" else 0)
+                try:
+                    return datetime.datetime(
+                        int(year), month, int(day), hour, int(minute), int(second)
+                    )
+                except ValueError:
+                    pass
+
+        for timeFormat in self.timeFormats:
+            try:
+                return datetime.datetime.strptime(time_s, timeFormat)
+            except ValueError:
+                pass
+        raise ValueError(f"{time_s} could not be parsed as a date/time")
+
+    def __next__(self):
+        while True:
+            try:
+                row = next(self.reader)
+            except TypeError:
+                raise StopIteration
+
+            # Skip blank lines, like csv.DictReader does
+            if not row:
+                continue
+
+            if len(row) < 3:
+                logging.error(
+                    f"Missing {self.fieldnames[len(row)]} value line {self.reader.line_num}"
+                )
+                raise StopIteration
+            time_s, o2_s, bpm_s = row[:3]
+
+            # these records seem to exist when the device is finished with a
+            # collection; skip them before doing any parsing
+            if o2_s == "255" and bpm_s == "65535":
+                continue
+
+            try:
+                timestamp = self.parse_time(time_s)
+            except ValueError:
+                logging.error(
+                    f'Invalid date/time "{time_s}" on line {self.reader.line_num}'
+                )
+                raise StopIteration
+
+            # Check for digits up front, rather than letting int() raise an
+            # exception for empty or invalid values
+            if o2_s.strip().isdecimal():
+                o2 = int(o2_s)
+            else:
+                logging.warning(
+                    f"Empty/invalid SpO2(%) value line {self.reader.line_num}"
+                )
+                o2 = None
+
+            if bpm_s.strip().isdecimal():
+                bpm = int(bpm_s)
+            else:
+                logging.warning(
+                    f"Empty/invalid Pulse Rate(bpm) value line {self.reader.line_num}"
+                )
+                bpm = None
+
+            return (timestamp, o2, bpm)
@@ -0,0 +1,22 @@
+# coding: utf-8
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2024 Paul Fagerburg
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+"""Convert pulse oximeter CSV files into the MedView DAT file format.
+
+The command line entry points, main and o2insight2medview, are looked up
+lazily (PEP 562), so importing the package or one of its modules doesn't
+also load the command line interface.
+"""
+
+__all__ = ["main", "o2insight2medview"]
+
+
+def __getattr__(name):
+    if name in __all__:
+        from . import cli
+
+        return getattr(cli, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
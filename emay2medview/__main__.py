@@ -0,0 +1,11 @@
+# coding: utf-8
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2024 Paul Fagerburg
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+"""Run the converter with `python -m emay2medview`."""
+
+from .cli import main
+
+main()
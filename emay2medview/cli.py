@@ -0,0 +1,182 @@
+#!/usr/bin/env python
+# coding: utf-8
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2024 Paul Fagerburg
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+"""
+Convert an EMAY pulse oximiter CSV file into the MD300W1 DAT file format that OSCAR can import.
+
+Based on code by user "joeblough", used by permission. Original post at
+https://www.apneaboard.com/forums/Thread-python-file-converter-for-EMAY-sleep-pulse-oximeter
+"""
+
+import contextlib
+import functools
+import gc
+import logging
+import os
+
+# Click, the readers, the writer, tqdm, and lzma are imported when they're
+# needed, so that e.g. importing this module, --help, or converting one format
+# doesn't pay for loading all of them. Python can be built without lzma, and
+# then only --compress fails.
+
+# Number of records to process between progress bar updates
+progress_batch = 1024
+
+
+@functools.lru_cache(maxsize=None)
+def command():
+    """Build the click command for the command line interface.
+
+    It's only built once, even if main() is called more than once.
+    """
+    import click
+
+    @click.command()
+    @click.argument("csv", type=click.Path(exists=True))
+    @click.option(
+        "--output-file",
+        "-o",
+        default=None,
+        help="Uses location and naming convention of the CSV file if not specified",
+    )
+    @click.option(
+        "--input-format",
+        "-f",
+        envvar="CSV_FORMAT",
+        type=click.Choice(["emay", "o2insight"]),
+        default="emay",
+        help="CSV file data format",
+    )
+    @click.option(
+        "--time-offset",
+        type=click.INT,
+        default=0,
+        help="Adjust times in the output data by this many seconds (positive or negative)",
+    )
+    @click.option(
+        "--compress",
+        is_flag=True,
+        default=False,
+        help="Also write an xz-compressed copy of the output file, for archiving",
+    )
+    def emay2medview(**params):
+        convert(**params)
+
+    return emay2medview
+
+
+def main(args=None):
+    """Entry point for the emay2medview command."""
+    return command()(args)
+
+
+def convert(**params):
+    input_filename = params["csv"]
+    input_format = params["input_format"]
+    timeOffset = params["time_offset"]
+
+    if params["output_file"] is None:
+        basename, _ = os.path.splitext(input_filename)
+        output_filename = basename + ".dat"
+        print(f"Converting {input_filename} into {output_filename} ...")
+    else:
+        output_filename = params["output_file"]
+
+    from . import MedViewFileWriter
+
+    # The readers take the raw bytes and decode them all at once
+    with open(input_filename, "rb") as csvfile, no_gc():
+        if input_format == "o2insight":
+            from . import O2InsightProReader
+
+            csv = O2InsightProReader.O2InsightProReader(csvfile)
+        else:
+            from . import EmayFileReader
+
+            csv = EmayFileReader.EmayFileReader(csvfile)
+
+        with open(output_filename, "wb") as datfile:
+            with MedViewFileWriter.MedViewFileWriter(
+                datfile, timeOffset
+            ) as medview, progress(description="Processing records") as bar:
+                # Updating the progress bar for every record costs more than
+                # converting the record, so update it in batches
+                pending = 0
+                write_record = medview.write_record
+                for timestamp, o2, bpm in csv:
+                    pending += 1
+                    if pending == progress_batch:
+                        bar.update(pending)
+                        pending = 0
+
+                    if not o2 or not bpm:
+                        logging.info(f"Missing data for time {timestamp}, skip")
+                        continue
+
+                    write_record(timestamp, o2, bpm)
+                bar.update(pending)
+
+    if params["compress"]:
+        compress_file(output_filename)
+
+
+def progress(description=None, max=0, unit=None, color=None, position=None, leave=True):
+    from tqdm import tqdm
+
+    if unit is None:
+        unit = " records"
+    else:
+        unit = " {unit}".format(unit=unit)
+
+    bar = tqdm(
+        unit=unit,
+        total=max,
+        colour=color,
+        position=position,
+        leave=leave,
+        mininterval=0.5,
+    )
+
+    if description is not None:
+        bar.set_description(description)
+
+    return bar
+
+
+def compress_file(filename):
+    """Write an xz-compressed copy of a file next to it, with ".xz" appended.
+
+    The records in a DAT file are mostly the same few bytes over and over
+    (padding, date, and slowly changing readings), so it compresses very well.
+    """
+    import lzma
+    import shutil
+
+    with open(filename, "rb") as src, lzma.open(filename + ".xz", "wb") as dst:
+        shutil.copyfileobj(src, dst)
+
+
+@contextlib.contextmanager
+def no_gc():
+    """Turn off the cyclic garbage collector for the duration of the conversion.
+
+    Reading a file creates lots of small objects (rows, timestamps, records)
+    that never form reference cycles, but their sheer number keeps triggering
+    collections that scan all of them.
+    """
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+def o2insight2medview():
+    os.environ["CSV_FORMAT"] = "o2insight"
+    main()
@@ -9,14 +9,77 @@
 Run all unit tests
 """
 
+import compileall
+import importlib.util
+import os
+import signal
+import subprocess
 import sys
 import unittest
 
-tests = ("EmayFileReader_test", "MedViewFileWriter_test", "FuzzyDateTimeParser_test")
+tests = (
+    "EmayFileReader_test",
+    "MedViewFileWriter_test",
+    "FuzzyDateTimeParser_test",
+    "O2InsightProReader_test",
+    "cli_test",
+)
+
+# The tests are next to this script, which may be run from another directory
+here = os.path.dirname(os.path.abspath(__file__))
 
 if __name__ == "__main__":
+    # Byte-compile the package and the tests up front, so the test processes
+    # don't each compile the same modules on a fresh checkout
+    compileall.compile_dir(os.path.join(here, "emay2medview"), quiet=1)
     for test in tests:
+        compileall.compile_file(os.path.join(here, f"{test}.py"), quiet=1)
+
+    # With pytest-xdist installed (pip install .[tests]), run the tests in
+    # parallel with one worker per CPU core
+    if importlib.util.find_spec("xdist") is not None:
+        import pytest
+
+        paths = [os.path.join(here, f"{test}.py") for test in tests]
+        sys.exit(pytest.main(["-n", "auto"] + paths))
+
+    # With a single CPU, separate processes can't run at the same time and only
+    # add start-up cost, so load all of the modules into one suite and run it
+    if (os.cpu_count() or 1) < 2:
+        loader = unittest.TestLoader()
+        suite = unittest.TestSuite(loader.loadTestsFromName(test) for test in tests)
+        result = unittest.TextTestRunner().run(suite)
+        sys.exit(0 if result.wasSuccessful() else 1)
+
+    # Otherwise, the test modules are independent of each other, so run each
+    # one in its own interpreter, all at the same time. If one of them crashes,
+    # only that module's results are lost.
+    procs = [
+        subprocess.Popen(
+            [sys.executable, "-m", "unittest", test],
+            cwd=here,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+        )
+        for test in tests
+    ]
+
+    # Every module runs to completion, so the summary covers all of them
+    failed = []
+    for test, proc in zip(tests, procs):
+        out, _ = proc.communicate()
         print(f"Running {test}")
-        result = unittest.main(test, exit=False).result
-        if result.failures or result.errors:
-            sys.exit(-1)
+        print(out.decode(), end="")
+        if proc.returncode < 0:
+            # Killed by a signal, e.g. a segfault, before it could report
+            name = signal.Signals(-proc.returncode).name
+            print(f"{test} crashed ({name})")
+            failed.append(f"{test} (crashed)")
+        elif proc.returncode != 0:
+            failed.append(test)
+
+    print()
+    if failed:
+        print(f"FAILED: {', '.join(failed)}")
+        sys.exit(1)
+    print(f"All {len(tests)} test modules passed")
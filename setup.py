@@ -1,23 +1,24 @@
 #!/usr/bin/env python3
 
-from setuptools import setup
+from setuptools import find_packages, setup
 
 
 setup(
     name="emay2medview",
     version="0.0.0",
-    py_modules=[
-        "emay2medview",
-        "EmayFileReader",
-        "O2InsightProReader",
-        "MedViewFileWriter",
-        "FuzzyDateTimeParser",
-    ],
+    packages=find_packages(),
+    python_requires=">=3.7",
     install_requires=[
         "Click",
         "click-option-group",
         "tqdm",
     ],
+    extras_require={
+        "tests": [
+            "pytest",
+            "pytest-xdist",
+        ],
+    },
     entry_points={
         "console_scripts": [
             "emay2medview=emay2medview:main",